@@ -12,15 +12,24 @@ for which there is low coverage in our already available data.
 
 import argparse
 import contextlib
-import functools
+import hashlib
+import heapq
+import json
 import multiprocessing
 import pathlib
-import tempfile
+import shelve
 
 from openff.toolkit.topology import Molecule
 from openff.toolkit.typing.engines.smirnoff import ForceField
+import numpy as np
 import pandas as pd
 
+# RDKit is optional; without it, matching falls back to the OpenFF toolkit
+try:
+    from rdkit import Chem
+except ImportError:
+    Chem = None
+
 parser = argparse.ArgumentParser(
     description=(
         "Select molecules with chemistries where we are seeking to improve data coverage. "
@@ -94,7 +103,17 @@ parser.add_argument(
     ),
     required=False
 )
-
+parser.add_argument(
+    "-cd", "--cache-directory",
+    type=str,
+    default=None,
+    help=(
+        "If specified, cache the matches of each molecule in this directory, "
+        "so later runs with the same groups do not label it again. "
+        "If not specified, nothing is cached."
+    ),
+    required=False
+)
 
 
 def main():
@@ -110,9 +129,11 @@ def main():
         output_count_file=args.output_count,
         count_threshold=args.count_threshold,
         only_top_n=args.only_top_n,
+        cache_directory=args.cache_directory,
     )
 
 
+    
 def draw_checkmol():
     """
     Draw the checkmol SMARTS for verification.
@@ -151,6 +172,7 @@ def search_all_smiles(
     output_count_file: str = None,
     count_threshold: int = 1,
     only_top_n: int = -1,
+    cache_directory: str = None,
 ):
     """
     Search all SMILES strings for rare environments and write to a CSV file.
@@ -171,6 +193,8 @@ def search_all_smiles(
         Path to the output CSV file. If not specified, this file will not be written.
     output_count_file : str, optional
         Path to the output CSV file. If not specified, this file will not be written.
+    cache_directory : str, optional
+        Directory to cache matches in across runs. If not specified, nothing is cached.
     """
 
     # check inputs
@@ -182,62 +206,165 @@ def search_all_smiles(
     if output_count_file:
         output_count_file = pathlib.Path(str(output_count_file))
         output_count_file.parent.mkdir(exist_ok=True, parents=True)
-    
+        
     nprocs = cast_or_error(nprocs, int, "-np/--nproc")
     count_threshold = cast_or_error(count_threshold, int, "-c/--count-threshold")
     only_top_n = cast_or_error(only_top_n, int, "-n/--only-top-n")
     if only_top_n == 0:
         raise ValueError("-n/--only-top-n cannot be 0")
 
-    forcefield = load_forcefield()
-    empty_entry = { group: False for group in CHECKMOL_GROUPS }
-    for parameter_id in LOW_COVERAGE_PARAMETERS:
-        empty_entry[parameter_id] = False
-    all_entries = []
+    # only label each unique molecule once, and only parse
+    # each distinct input SMILES once to find it
+    canonical_by_smiles = {
+        smi: canonicalize_smiles(smi) for smi in dict.fromkeys(smiles)
+    }
+    canonical_smiles = [canonical_by_smiles[smi] for smi in smiles]
+    unique_smiles = list(dict.fromkeys(canonical_smiles))
 
-    labeller = functools.partial(
-        label_single_smiles,
-        forcefield=forcefield,
-        empty_entry=empty_entry,
-    )
-    with multiprocessing.Pool(nprocs) as pool:
-        all_entries = list(
-            _progress_bar(
-                pool.imap(labeller, smiles),
-                desc="Matching molecules",
-                total=len(smiles),
-            )
-        )
-    all_entries = [x for x in all_entries if x is not None]
-    if not len(all_entries):
+    if cache_directory:
+        cache = shelve.open(get_cache_path(cache_directory))
+    else:
+        cache = contextlib.nullcontext({})
+
+    with cache as cache:
+        masks_by_smiles = {
+            smi: cache[smi] for smi in unique_smiles if smi in cache
+        }
+        smiles_to_label = [
+            smi for smi in unique_smiles if smi not in masks_by_smiles
+        ]
+
+        # each worker loads the force field once, so only SMILES are sent.
+        # Results are keyed by SMILES, so the order they arrive in does not matter
+        if smiles_to_label:
+            # forked workers inherit a force field loaded here, so it
+            # is parsed once instead of once per worker
+            if nprocs == 1 or multiprocessing.get_start_method() == "fork":
+                _init_worker()
+            if nprocs == 1:
+                # a single worker gains nothing from a child process,
+                # so label in this one and skip pickling every SMILES
+                pool = contextlib.nullcontext()
+                results = map(_label_keyed, smiles_to_label)
+            else:
+                chunksize = max(1, len(smiles_to_label) // (nprocs * 16))
+                pool = multiprocessing.Pool(nprocs, initializer=_init_worker)
+                results = pool.imap_unordered(
+                    _label_keyed, smiles_to_label, chunksize=chunksize
+                )
+            with pool:
+                for smi, mask in _progress_bar(
+                    results,
+                    desc="Matching molecules",
+                    total=len(smiles_to_label),
+                ):
+                    masks_by_smiles[smi] = cache[smi] = mask
+
+    if all(mask is None for mask in masks_by_smiles.values()):
         print(f"No valid matches found -- skipping writing to {output_file}")
         return
 
-    all_entries = sorted(all_entries, key=lambda x: x["Count"], reverse=True)
-    df = pd.DataFrame(all_entries)
-    df = df[df["Count"] >= count_threshold]
+    # expand back out to the input, keeping the original SMILES.
+    # Only the rows that will be written are kept, as (count, SMILES, mask)
+    def iter_rows():
+        for smi, canonical in zip(smiles, canonical_smiles):
+            mask = masks_by_smiles[canonical]
+            if mask is not None:
+                count = popcount(mask)
+                if count >= count_threshold:
+                    yield count, smi, mask
 
+    # both of these are stable, so ties keep their input order
     if only_top_n > 0:
-        df = df.head(only_top_n)
+        rows = heapq.nlargest(only_top_n, iter_rows(), key=lambda x: x[0])
+    else:
+        rows = sorted(iter_rows(), key=lambda x: x[0], reverse=True)
 
-    with open(output_file, "w") as f:
-        f.write("\n".join(df["SMILES"].values))
-    print(f"Wrote {len(df)} molecules to {output_file}")
+    # stream the lines through a large buffer instead of joining them
+    # into one string; the file still has no trailing newline
+    with open(output_file, "w", buffering=1 << 20) as f:
+        f.writelines(
+            smi if i == 0 else "\n" + smi
+            for i, (_, smi, _) in enumerate(rows)
+        )
+    print(f"Wrote {len(rows)} molecules to {output_file}")
 
-    core_keys = ["SMILES", "Count"]
-    added_keys = [col for col in df.columns if col not in core_keys]
     if output_count_file:
-        counts = df[added_keys].sum()
+        counts = sum_matches([mask for _, _, mask in rows])
+        counts = pd.Series(counts, index=KEY_ORDER)
         counts.to_csv(output_count_file, header=False)
         print(f"Wrote counts to {output_count_file}")
 
     if output_csv_file:
-        keys = core_keys + added_keys
-        df[keys].to_csv(output_csv_file, index=False)
-        n_groups = len(df.columns) - 2
-        print(f"Wrote {len(df)} molecules and matches to {n_groups} groups to {output_csv_file}")
+        with open(output_csv_file, "w") as f:
+            for i, df in enumerate(iter_match_tables(rows)):
+                df.to_csv(f, header=(i == 0), index=False)
+        n_groups = len(KEY_ORDER)
+        print(f"Wrote {len(rows)} molecules and matches to {n_groups} groups to {output_csv_file}")
+
+
+if hasattr(int, "bit_count"):  # Python 3.10+
+    popcount = int.bit_count
+else:
+    def popcount(mask: int) -> int:
+        """Count the number of bits set in a mask."""
+        return bin(mask).count("1")
+
+
+def sum_matches(masks, chunksize: int = 10000):
+    """Count how many masks have each bit set, a chunk at a time."""
+    counts = np.zeros(len(KEY_ORDER), dtype=np.int64)
+    for start in range(0, len(masks), chunksize):
+        chunk = masks[start:start + chunksize]
+        counts += unpack_masks(chunk, len(KEY_ORDER)).sum(axis=0)
+    return counts
+
+
+def iter_match_tables(rows, chunksize: int = 10000):
+    """
+    Yield tables of SMILES, Count, and matches to each group
+    from (count, SMILES, mask) rows, a chunk at a time.
+
+    This avoids holding the full boolean table in memory at once.
+    At least one table is always yielded, even if there are no rows.
+    """
+    for start in range(0, max(len(rows), 1), chunksize):
+        chunk = rows[start:start + chunksize]
+        matches = unpack_masks([mask for _, _, mask in chunk], len(KEY_ORDER))
+        df = pd.DataFrame(matches, columns=KEY_ORDER)
+        df.insert(0, "Count", [count for count, _, _ in chunk])
+        df.insert(0, "SMILES", [smi for _, smi, _ in chunk])
+        yield df
+
+
+def unpack_masks(masks, n_keys: int):
+    """
+    Unpack integer bitmasks into a boolean array.
+
+    Bit ``i`` of each mask becomes column ``i`` of its row.
+    """
+    n_bytes = max(1, (n_keys + 7) // 8)
+    packed = np.frombuffer(
+        b"".join(mask.to_bytes(n_bytes, "little") for mask in masks),
+        dtype=np.uint8,
+    ).reshape(-1, n_bytes)
+    bits = np.unpackbits(packed, axis=1, bitorder="little")
+    return bits[:, :n_keys].astype(bool)
+
+
+def get_cache_path(cache_directory: str) -> str:
+    """
+    Get the path of the cache for the groups and force field in this script.
+
+    The file name is a hash of everything that affects the matches,
+    so a cache written by a different version of this script is never read.
+    """
+    rules = json.dumps([CHECKMOL_GROUPS, KEY_ORDER, FORCEFIELD])
+    rules_hash = hashlib.blake2b(rules.encode(), digest_size=8).hexdigest()
+    cache_directory = pathlib.Path(str(cache_directory))
+    cache_directory.mkdir(exist_ok=True, parents=True)
+    return str(cache_directory / f"matches-{rules_hash}")
 
-    
 
 def _progress_bar(iterable_, **kwargs):
     """Try to use tqdm if it is available, otherwise return the iterable."""
@@ -247,49 +374,250 @@ def _progress_bar(iterable_, **kwargs):
     except ImportError:
         return iterable_
 
+def canonicalize_smiles(smi: str) -> str:
+    """
+    Canonicalize a SMILES string so duplicate molecules can be identified.
+
+    If RDKit is not available, or the SMILES cannot be parsed,
+    the input SMILES is returned unchanged.
+    """
+    if Chem is None:
+        return smi
+
+    rdmol = Chem.MolFromSmiles(smi)
+    if rdmol is None:
+        return smi
+    return Chem.MolToSmiles(rdmol)
+
+def rdmol_from_smiles(smi: str):
+    """
+    Parse a SMILES string into an RDKit molecule with explicit hydrogens.
+
+    Aromaticity is perceived with the MDL model, as in the OpenFF toolkit,
+    so SMARTS matches are the same as with an OpenFF molecule.
+    Returns None if the SMILES cannot be parsed.
+    """
+    rdmol = Chem.MolFromSmiles(smi, sanitize=False)
+    if rdmol is None:
+        return None
+    try:
+        Chem.SanitizeMol(
+            rdmol,
+            Chem.SANITIZE_ALL
+            ^ Chem.SANITIZE_ADJUSTHS
+            ^ Chem.SANITIZE_SETAROMATICITY,
+        )
+        Chem.SetAromaticity(rdmol, Chem.AromaticityModel.AROMATICITY_MDL)
+    except Exception:
+        return None
+    return Chem.AddHs(rdmol)
+
 def load_forcefield():
     """Load the OpenFF 2.2.0 force field from the string below."""
-    # write force field to temp file and load
-    with tempfile.NamedTemporaryFile("w") as f:
-        f.write(FORCEFIELD)
-        forcefield = ForceField(f.name)
-    return forcefield
-
-def label_single_smiles(
-    smi: str,
-    forcefield: ForceField,
-    empty_entry,
-):
-    """Label a single SMILES string with rare environments."""
-    # ignore warnings about stereo
-    with capture_toolkit_warnings():
-        try:
-            mol = Molecule.from_smiles(smi, allow_undefined_stereo=True)
-        except Exception as e:
+    # ForceField accepts the XML contents directly
+    return ForceField(FORCEFIELD)
+
+def get_low_coverage_smirks(forcefield: ForceField):
+    """
+    Get the SMIRKS of each low coverage parameter in the force field.
+
+    Handlers without any low coverage parameters are deregistered
+    from the force field, as they can never contribute a match.
+    """
+    low_coverage_smirks = {}
+    for handler_name in list(forcefield.registered_parameter_handlers):
+        handler = forcefield.get_parameter_handler(handler_name)
+        n_found = len(low_coverage_smirks)
+        for parameter in handler.parameters:
+            label = parameter.id if parameter.id else parameter.name
+            if label in LOW_COVERAGE_PARAMETERS:
+                low_coverage_smirks[label] = parameter.smirks
+        if len(low_coverage_smirks) == n_found:
+            forcefield.deregister_parameter_handler(handler_name)
+    return low_coverage_smirks
+
+def compile_queries(patterns):
+    """
+    Compile SMARTS patterns to RDKit query molecules once.
+
+    Returns None if RDKit is not available, in which case
+    the OpenFF toolkit is used to match each SMARTS instead.
+    """
+    if Chem is None:
+        return None
+
+    return {
+        name: Chem.MolFromSmarts(smirks)
+        for name, smirks in patterns.items()
+    }
+
+def _get_node_elements(lines, i):
+    """
+    Return the elements required by the query node described on line ``i``
+    of an RDKit query description, and the index of the line after it.
+    """
+    depth = len(lines[i]) - len(lines[i].lstrip())
+    words = lines[i].split()
+    children = []
+    j = i + 1
+    while j < len(lines) and len(lines[j]) - len(lines[j].lstrip()) > depth:
+        child, j = _get_node_elements(lines, j)
+        children.append(child)
+
+    if words == ["AtomAnd"]:
+        return set().union(*children), j
+    if words == ["AtomOr"]:
+        return set.intersection(*children), j
+    if words[0] in ("AtomAtomicNum", "AtomType") and words[2:] == ["=", "val"]:
+        # aromatic atom types are offset by 1000
+        return {int(words[1]) % 1000}, j
+    # anything else, including negations and recursive SMARTS,
+    # does not require a particular element
+    return set(), j
+
+def get_required_elements(query):
+    """
+    Return the atomic numbers that any match of an RDKit query molecule
+    must contain. This errs on the side of requiring fewer elements.
+    """
+    required = set()
+    for atom in query.GetAtoms():
+        lines = [
+            line for line in atom.DescribeQuery().splitlines()
+            if line.strip()
+        ]
+        required |= _get_node_elements(lines, 0)[0]
+    return frozenset(required)
+
+def compile_catalogs(patterns):
+    """
+    Compile SMARTS patterns into RDKit FilterCatalogs,
+    so all of them can be matched against a molecule in a few calls.
+
+    Patterns are grouped by the uncommon elements they require, so
+    a molecule is only matched against the groups it could match.
+    Returns a list of (required elements, catalog) pairs,
+    or None if RDKit is not available.
+    """
+    queries = compile_queries(patterns)
+    if queries is None:
+        return None
+
+    from rdkit.Chem import FilterCatalog
+
+    catalogs = {}
+    for name, query in queries.items():
+        # nearly every molecule has these, so grouping
+        # on them would only add catalogs to check
+        required = get_required_elements(query) - {1, 6, 7, 8}
+        if required not in catalogs:
+            catalogs[required] = FilterCatalog.FilterCatalog()
+        # build from the query molecule so the SMARTS is matched as written
+        matcher = FilterCatalog.SmartsMatcher(name, query, 1)
+        catalogs[required].AddEntry(
+            FilterCatalog.FilterCatalogEntry(name, matcher)
+        )
+    return list(catalogs.items())
+
+def find_matching_patterns(mol, rdmol, patterns, catalogs=None):
+    """
+    Yield the name of each SMARTS pattern that matches the molecule.
+
+    Compiled RDKit FilterCatalogs are used if given; otherwise
+    each pattern is matched with the OpenFF toolkit.
+    """
+    if catalogs is not None:
+        elements = {atom.GetAtomicNum() for atom in rdmol.GetAtoms()}
+        for required, catalog in catalogs:
+            if required <= elements:
+                for entry in catalog.GetMatches(rdmol):
+                    yield entry.GetDescription()
+    else:
+        for name, smirks in patterns.items():
+            if len(mol.chemical_environment_matches(smirks)):
+                yield name
+
+# set in each worker process by _init_worker
+_FORCEFIELD = None
+_KEY_INDEX = None
+_PATTERNS = None
+_CATALOGS = None
+
+def _init_worker():
+    """Load the force field and compile queries once per worker process."""
+    global _FORCEFIELD, _KEY_INDEX, _PATTERNS, _CATALOGS
+
+    # already set up in this process, or inherited from the parent
+    if _FORCEFIELD is not None:
+        return
+
+    _FORCEFIELD = load_forcefield()
+    _KEY_INDEX = { key: i for i, key in enumerate(KEY_ORDER) }
+    # with RDKit, the checkmol groups and low coverage SMIRKS
+    # are all matched in a few calls
+    _PATTERNS = dict(CHECKMOL_GROUPS)
+    _PATTERNS.update(get_low_coverage_smirks(_FORCEFIELD))
+    _CATALOGS = compile_catalogs(_PATTERNS)
+
+def label_single_smiles(smi: str):
+    """
+    Label a single SMILES string with rare environments.
+
+    Returns an integer bitmask where bit ``i`` is set if ``KEY_ORDER[i]``
+    matches, or None if the SMILES is invalid.
+    This must be called in a process that has been set up with _init_worker.
+    """
+    if _CATALOGS is not None:
+        # parse with RDKit directly, as most molecules
+        # never need to be converted to an OpenFF molecule
+        mol = None
+        rdmol = rdmol_from_smiles(smi)
+        if rdmol is None:
             return None
-    
-    atomic_numbers = [atom.atomic_number for atom in mol.atoms]
+        atomic_numbers = [atom.GetAtomicNum() for atom in rdmol.GetAtoms()]
+    else:
+        rdmol = None
+        # ignore warnings about stereo
+        with capture_toolkit_warnings():
+            try:
+                mol = Molecule.from_smiles(smi, allow_undefined_stereo=True)
+            except Exception as e:
+                return None
+        atomic_numbers = [atom.atomic_number for atom in mol.atoms]
+
     if 0 in atomic_numbers:
         return None
 
-    entry = dict(empty_entry)
+    mask = 0
+    needs_labelling = False
+    for name in find_matching_patterns(mol, rdmol, _PATTERNS, _CATALOGS):
+        if name in CHECKMOL_GROUPS:
+            mask |= 1 << _KEY_INDEX[name]
+        else:
+            needs_labelling = True
 
-    # does it match any checkmol groups?
-    for group, smirks in CHECKMOL_GROUPS.items():
-        matches = mol.chemical_environment_matches(smirks)
-        if len(matches):
-            entry[group] = True
+    # a parameter can only be assigned if its SMIRKS matches,
+    # so skip the expensive labelling if none of them do.
+    # A match does not mean it is assigned, as a later parameter may win
+    if needs_labelling:
+        if mol is None:
+            with capture_toolkit_warnings():
+                try:
+                    mol = Molecule.from_rdkit(rdmol, allow_undefined_stereo=True)
+                except Exception as e:
+                    return None
+        labels = _FORCEFIELD.label_molecules(mol.to_topology())[0]
+        for parameters in labels.values():
+            for parameter in parameters.values():
+                label = parameter.id if parameter.id else parameter.name
+                if label in _KEY_INDEX:
+                    mask |= 1 << _KEY_INDEX[label]
 
-    labels = forcefield.label_molecules(mol.to_topology())[0]
-    for parameters in labels.values():
-        for parameter in parameters.values():
-            label = parameter.id if parameter.id else parameter.name
-            if label in entry:
-                entry[label] = True
+    return mask
 
-    entry["Count"] = sum(entry.values())
-    entry["SMILES"] = smi
-    return entry
+def _label_keyed(smi: str):
+    """Label a SMILES string and return it with its mask."""
+    return smi, label_single_smiles(smi)
 
 @contextlib.contextmanager
 def capture_toolkit_warnings(run: bool = True):  # pragma: no cover
@@ -417,40 +745,15 @@ LOW_COVERAGE_PARAMETERS = [
 
 ]
 
+# order of the bits in the masks returned by label_single_smiles
+KEY_ORDER = list(CHECKMOL_GROUPS) + LOW_COVERAGE_PARAMETERS
+
 FORCEFIELD = """\
 <?xml version="1.0" encoding="utf-8"?>
 <SMIRNOFF version="0.3" aromaticity_model="OEAroModel_MDL">
     <Author>The Open Force Field Initiative</Author>
     <Date>2024-04-18</Date>
-    <Constraints version="0.3">
-        <Constraint smirks="[#1:1]-[*:2]" id="c1"></Constraint>
-        <Constraint smirks="[#1:1]-[#8X2H2+0:2]-[#1]" id="c-tip3p-H-O" distance="0.9572 * angstrom ** 1"></Constraint>
-        <Constraint smirks="[#1:1]-[#8X2H2+0]-[#1:2]" id="c-tip3p-H-O-H" distance="1.5139006545247014 * angstrom ** 1"></Constraint>
-    </Constraints>
     <Bonds version="0.4" potential="harmonic" fractional_bondorder_method="AM1-Wiberg" fractional_bondorder_interpolation="linear">
-        <Bond smirks="[#6X4:1]-[#6X4:2]" id="b1" length="1.533627603844 * angstrom ** 1" k="430.6027811279 * kilocalorie_per_mole ** 1 * angstrom ** -2"></Bond>
-        <Bond smirks="[#6X4:1]-[#6X3:2]" id="b2" length="1.50959128588 * angstrom ** 1" k="478.7391355181 * kilocalorie_per_mole ** 1 * angstrom ** -2"></Bond>
-        <Bond smirks="[#6X4:1]-[#6X3:2]=[#8X1+0]" id="b3" length="1.529016943769 * angstrom ** 1" k="405.2741855475 * kilocalorie_per_mole ** 1 * angstrom ** -2"></Bond>
-        <Bond smirks="[#6X3:1]-[#6X3:2]" id="b4" length="1.467873223618 * angstrom ** 1" k="534.8587647857 * kilocalorie_per_mole ** 1 * angstrom ** -2"></Bond>
-        <Bond smirks="[#6X3:1]:[#6X3:2]" id="b5" length="1.400706064009 * angstrom ** 1" k="753.7514414653 * kilocalorie_per_mole ** 1 * angstrom ** -2"></Bond>
-        <Bond smirks="[#6X3:1]=[#6X3:2]" id="b6" length="1.373209032276 * angstrom ** 1" k="904.0483623942 * kilocalorie_per_mole ** 1 * angstrom ** -2"></Bond>
-        <Bond smirks="[#6:1]-[#7:2]" id="b7" length="1.477375101044 * angstrom ** 1" k="451.9422814679 * kilocalorie_per_mole ** 1 * angstrom ** -2"></Bond>
-        <Bond smirks="[#6X3:1]-[#7X3:2]" id="b8" length="1.389502949007 * angstrom ** 1" k="658.5261427735 * kilocalorie_per_mole ** 1 * angstrom ** -2"></Bond>
-        <Bond smirks="[#6X4:1]-[#7X3:2]-[#6X3]=[#8X1+0]" id="b9" length="1.462099794876 * angstrom ** 1" k="482.858522335 * kilocalorie_per_mole ** 1 * angstrom ** -2"></Bond>
-        <Bond smirks="[#6X3:1](=[#8X1+0])-[#7X3:2]" id="b10" length="1.383765741722 * angstrom ** 1" k="653.9549956682 * kilocalorie_per_mole ** 1 * angstrom ** -2"></Bond>
-        <Bond smirks="[#6X3:1]-[#7X2:2]" id="b11" length="1.386553566522 * angstrom ** 1" k="591.4003116832 * kilocalorie_per_mole ** 1 * angstrom ** -2"></Bond>
-        <Bond smirks="[#6X3:1]:[#7X2,#7X3+1:2]" id="b12" length="1.338439274717 * angstrom ** 1" k="774.0798406678 * kilocalorie_per_mole ** 1 * angstrom ** -2"></Bond>
-        <Bond smirks="[#6X3:1]=[#7X2,#7X3+1:2]" id="b13" length="1.309372378949 * angstrom ** 1" k="1010.327278232 * kilocalorie_per_mole ** 1 * angstrom ** -2"></Bond>
-        <Bond smirks="[#6X3:1](~!@[#7X3])(~!@[#7X3])~!@[#7X3:2]" id="b13a" length="1.304468222569 * angstrom ** 1" k="1171.510786135 * angstrom ** -2 * mole ** -1 * kilocalorie ** 1"></Bond>
-        <Bond smirks="[#6:1]-[#8:2]" id="b14" length="1.426323519316 * angstrom ** 1" k="517.9055609326 * kilocalorie_per_mole ** 1 * angstrom ** -2"></Bond>
-        <Bond smirks="[#6X3:1]-[#8X1-1:2]" id="b15" length="1.277730087271 * angstrom ** 1" k="1088.633667712 * kilocalorie_per_mole ** 1 * angstrom ** -2"></Bond>
-        <Bond smirks="[#6X4:1]-[#8X2H0:2]" id="b16" length="1.436323905911 * angstrom ** 1" k="454.0742933374 * kilocalorie_per_mole ** 1 * angstrom ** -2"></Bond>
-        <Bond smirks="[#6X3:1]-[#8X2:2]" id="b17" length="1.36337886368 * angstrom ** 1" k="587.6996587805 * kilocalorie_per_mole ** 1 * angstrom ** -2"></Bond>
-        <Bond smirks="[#6X3:1]-[#8X2H1:2]" id="b18" length="1.360361459598 * angstrom ** 1" k="692.682789202 * kilocalorie_per_mole ** 1 * angstrom ** -2"></Bond>
-        <Bond smirks="[#6X3a:1]-[#8X2H0:2]" id="b19" length="1.372026066276 * angstrom ** 1" k="637.5025487732 * kilocalorie_per_mole ** 1 * angstrom ** -2"></Bond>
-        <Bond smirks="[#6X3:1](=[#8X1])-[#8X2H0:2]" id="b20" length="1.356061963393 * angstrom ** 1" k="582.6841261163 * kilocalorie_per_mole ** 1 * angstrom ** -2"></Bond>
-        <Bond smirks="[#6:1]=[#8X1+0,#8X2+1:2]" id="b21" length="1.225002296183 * angstrom ** 1" k="1524.077000087 * kilocalorie_per_mole ** 1 * angstrom ** -2"></Bond>
-        <Bond smirks="[#6X3:1](~[#8X1])~[#8X1:2]" id="b22" length="1.259829790192 * angstrom ** 1" k="1181.44544879 * kilocalorie_per_mole ** 1 * angstrom ** -2"></Bond>
         <Bond smirks="[#6X3:1]~[#8X2+1:2]~[#6X3]" id="b23" length="1.3571444823426182 * angstrom ** 1" k="609.7328918443294 * kilocalorie_per_mole ** 1 * angstrom ** -2"></Bond>
         <Bond smirks="[#6X2:1]-[#6:2]" id="b24" length="1.43086402681 * angstrom ** 1" k="659.9778648157 * kilocalorie_per_mole ** 1 * angstrom ** -2"></Bond>
         <Bond smirks="[#6X2:1]-[#6X4:2]" id="b25" length="1.46106500945 * angstrom ** 1" k="600.2001645155 * kilocalorie_per_mole ** 1 * angstrom ** -2"></Bond>
@@ -520,29 +823,6 @@ FORCEFIELD = """\
         <Bond smirks="[#8:1]-[#1:2]" id="b88" length="0.9752301008088 * angstrom ** 1" k="1076.70158803 * kilocalorie_per_mole ** 1 * angstrom ** -2"></Bond>
     </Bonds>
     <Angles version="0.3" potential="harmonic">
-        <Angle smirks="[*:1]~[#6X4:2]-[*:3]" angle="109.9380527584 * degree ** 1" k="133.5126366319 * kilocalorie_per_mole ** 1 * radian ** -2" id="a1"></Angle>
-        <Angle smirks="[#1:1]-[#6X4:2]-[#1:3]" angle="108.3543135269 * degree ** 1" k="73.55327570151 * kilocalorie_per_mole ** 1 * radian ** -2" id="a2"></Angle>
-        <Angle smirks="[*;r3:1]~;@[*;r3:2]~;!@[*:3]" angle="117.4648242289 * degree ** 1" k="116.6950409809 * kilocalorie_per_mole ** 1 * radian ** -2" id="a4"></Angle>
-        <Angle smirks="[*:1]~;!@[*;r3:2]~;!@[*:3]" angle="114.9979324703 * degree ** 1" k="148.7002668567 * kilocalorie_per_mole ** 1 * radian ** -2" id="a5"></Angle>
-        <Angle smirks="[#1:1]-[*;r3:2]~;!@[*:3]" angle="115.1109939866 * degree ** 1" k="55.50694049537 * kilocalorie_per_mole ** 1 * radian ** -2" id="a6"></Angle>
-        <Angle smirks="[#6r4:1]-;@[#6r4:2]-;@[#6r4:3]" angle="87.42984452369 * degree ** 1" k="141.9340831094 * kilocalorie_per_mole ** 1 * radian ** -2" id="a7"></Angle>
-        <Angle smirks="[!#1:1]-[#6r4:2]-;!@[!#1:3]" angle="115.1602720493 * degree ** 1" k="212.5869538277 * kilocalorie_per_mole ** 1 * radian ** -2" id="a8"></Angle>
-        <Angle smirks="[!#1:1]-[#6r4:2]-;!@[#1:3]" angle="113.7820142404 * degree ** 1" k="115.5412584893 * kilocalorie_per_mole ** 1 * radian ** -2" id="a9"></Angle>
-        <Angle smirks="[*:1]~[#6X3:2]~[*:3]" angle="120.1049996386 * degree ** 1" k="169.0953155969 * kilocalorie_per_mole ** 1 * radian ** -2" id="a10"></Angle>
-        <Angle smirks="[#1:1]-[#6X3:2]~[*:3]" angle="119.8544859917 * degree ** 1" k="65.84475468128 * kilocalorie_per_mole ** 1 * radian ** -2" id="a11"></Angle>
-        <Angle smirks="[#1:1]-[#6X3:2]-[#1:3]" angle="117.693379803 * degree ** 1" k="43.36068465475 * kilocalorie_per_mole ** 1 * radian ** -2" id="a12"></Angle>
-        <Angle smirks="[*;r6:1]~;@[*;r5:2]~;@[*;r5;x2:3]" angle="129.7106976744 * degree ** 1" k="153.6717495861 * kilocalorie_per_mole ** 1 * radian ** -2" id="a13"></Angle>
-        <Angle smirks="[*;r6:1]~;@[*;r5;x4,*;r5;X4:2]~;@[*;r5;x2:3]" angle="110.8145273566 * degree ** 1" k="224.9724108845 * kilocalorie_per_mole ** 1 * radian ** -2" id="a13a"></Angle>
-        <Angle smirks="[*:1]~;!@[*;X3;r5:2]~;@[*;r5:3]" angle="124.801611398 * degree ** 1" k="101.803524732 * kilocalorie_per_mole ** 1 * radian ** -2" id="a14"></Angle>
-        <Angle smirks="[#8X1:1]~[#6X3:2]~[#8:3]" angle="123.6058900035 * degree ** 1" k="126.6200669144 * kilocalorie_per_mole ** 1 * radian ** -2" id="a15"></Angle>
-        <Angle smirks="[*:1]~[#6X2:2]~[*:3]" angle="178.06592484092022 * degree ** 1" k="99.91851476849 * kilocalorie_per_mole ** 1 * radian ** -2" id="a16"></Angle>
-        <Angle smirks="[*:1]~[#7X2:2]~[*:3]" angle="176.0234545467476 * degree ** 1" k="89.96041175564783 * kilocalorie_per_mole ** 1 * radian ** -2" id="a17"></Angle>
-        <Angle smirks="[*:1]~[#7X4,#7X3,#7X2-1:2]~[*:3]" angle="113.2116558678 * degree ** 1" k="248.1768682614 * kilocalorie_per_mole ** 1 * radian ** -2" id="a18"></Angle>
-        <Angle smirks="[*:1]@-[r!r6;#7X4,#7X3,#7X2-1:2]@-[*:3]" angle="93.92727646489 * degree ** 1" k="187.8484236925 * kilocalorie_per_mole ** 1 * radian ** -2" id="a18a"></Angle>
-        <Angle smirks="[#1:1]-[#7X4,#7X3,#7X2-1:2]-[*:3]" angle="109.2513757493 * degree ** 1" k="107.6482194711 * kilocalorie_per_mole ** 1 * radian ** -2" id="a19"></Angle>
-        <Angle smirks="[*:1]~[#7X3$(*~[#6X3,#6X2,#7X2+0]):2]~[*:3]" angle="121.7705343867 * degree ** 1" k="158.9566366884 * kilocalorie_per_mole ** 1 * radian ** -2" id="a20"></Angle>
-        <Angle smirks="[#1:1]-[#7X3$(*~[#6X3,#6X2,#7X2+0]):2]-[*:3]" angle="118.0636611293 * degree ** 1" k="74.20968211314 * kilocalorie_per_mole ** 1 * radian ** -2" id="a21"></Angle>
-        <Angle smirks="[*:1]~[#7X2+0:2]~[*:3]" angle="117.9267269648 * degree ** 1" k="290.5379151297 * kilocalorie_per_mole ** 1 * radian ** -2" id="a22"></Angle>
         <Angle smirks="[*:1]~[#7X2+0:2]~[#6X2:3](~[#16X1])" angle="144.3131862361 * degree ** 1" k="150.3988349754 * kilocalorie_per_mole ** 1 * radian ** -2" id="a23"></Angle>
         <Angle smirks="[#1:1]-[#7X2+0:2]~[*:3]" angle="111.6159575824 * degree ** 1" k="104.6951323738 * kilocalorie_per_mole ** 1 * radian ** -2" id="a24"></Angle>
         <Angle smirks="[#6,#7,#8:1]-[#7X3:2](~[#8X1])~[#8X1:3]" angle="117.5701099391 * degree ** 1" k="145.0320372744 * kilocalorie_per_mole ** 1 * radian ** -2" id="a25"></Angle>
@@ -566,12 +846,6 @@ FORCEFIELD = """\
         <Angle smirks="[*;r3:1]1~;@[*;r3:2]~;@[*;r3:3]1" angle="60.00126695381 * degree ** 1" k="111.1759590839 * kilocalorie_per_mole ** 1 * radian ** -2" id="a3"></Angle>
     </Angles>
     <ProperTorsions version="0.4" potential="k*(1+cos(periodicity*theta-phase))" default_idivf="auto" fractional_bondorder_method="AM1-Wiberg" fractional_bondorder_interpolation="linear">
-        <Proper smirks="[*:1]-[#6X4:2]-[#6X4:3]-[*:4]" periodicity1="3" phase1="0.0 * degree ** 1" id="t1" k1="0.143904881748 * mole ** -1 * kilocalorie ** 1" idivf1="1.0"></Proper>
-        <Proper smirks="[#6X4:1]-[#6X4:2]-[#6X4:3]-[#6X4:4]" periodicity1="3" periodicity2="2" periodicity3="1" phase1="0.0 * degree ** 1" phase2="180.0 * degree ** 1" phase3="180.0 * degree ** 1" id="t2" k1="0.3549667638131 * mole ** -1 * kilocalorie ** 1" k2="0.2399307824079 * mole ** -1 * kilocalorie ** 1" k3="0.9156101580834 * mole ** -1 * kilocalorie ** 1" idivf1="1.0" idivf2="1.0" idivf3="1.0"></Proper>
-        <Proper smirks="[#1:1]-[#6X4:2]-[#6X4:3]-[#1:4]" periodicity1="3" phase1="0.0 * degree ** 1" id="t3" k1="0.2279946533057 * mole ** -1 * kilocalorie ** 1" idivf1="1.0"></Proper>
-        <Proper smirks="[#1:1]-[#6X4:2]-[#6X4:3]-[#6X4:4]" periodicity1="3" phase1="0.0 * degree ** 1" id="t4" k1="0.0985377828486 * mole ** -1 * kilocalorie ** 1" idivf1="1.0"></Proper>
-        <Proper smirks="[#8X2:1]-[#6X4:2]-[#6X4:3]-[#8X2:4]" periodicity1="3" periodicity2="2" phase1="0.0 * degree ** 1" phase2="0.0 * degree ** 1" id="t5" k1="-0.01533770820035 * mole ** -1 * kilocalorie ** 1" k2="0.4191503124266 * mole ** -1 * kilocalorie ** 1" idivf1="1.0" idivf2="1.0"></Proper>
-        <Proper smirks="[#9:1]-[#6X4:2]-[#6X4:3]-[#9:4]" periodicity1="3" periodicity2="1" phase1="0.0 * degree ** 1" phase2="180.0 * degree ** 1" id="t6" k1="0.07331659440315 * mole ** -1 * kilocalorie ** 1" k2="-0.1968789511389 * mole ** -1 * kilocalorie ** 1" idivf1="1.0" idivf2="1.0"></Proper>
         <Proper smirks="[#17:1]-[#6X4:2]-[#6X4:3]-[#17:4]" periodicity1="3" periodicity2="1" phase1="0.0 * degree ** 1" phase2="180.0 * degree ** 1" id="t7" k1="0.6394408470579 * mole ** -1 * kilocalorie ** 1" k2="-1.404270761131 * mole ** -1 * kilocalorie ** 1" idivf1="1.0" idivf2="1.0"></Proper>
         <Proper smirks="[#35:1]-[#6X4:2]-[#6X4:3]-[#35:4]" periodicity1="3" periodicity2="1" phase1="0.0 * degree ** 1" phase2="180.0 * degree ** 1" id="t8" k1="1.077770345087 * mole ** -1 * kilocalorie ** 1" k2="-0.1123758770255 * mole ** -1 * kilocalorie ** 1" idivf1="1.0" idivf2="1.0"></Proper>
         <Proper smirks="[#1:1]-[#6X4:2]-[#6X4:3]-[#8X2:4]" periodicity1="3" periodicity2="1" phase1="0.0 * degree ** 1" phase2="0.0 * degree ** 1" id="t9" k1="0.1311347012225 * mole ** -1 * kilocalorie ** 1" k2="0.436546671918 * mole ** -1 * kilocalorie ** 1" idivf1="1.0" idivf2="1.0"></Proper>
@@ -747,57 +1021,6 @@ FORCEFIELD = """\
         <Proper smirks="[*:1]~[*:2]-[*:3]#[*:4]" periodicity1="1" phase1="0.0 * degree ** 1" id="t166" k1="0.0 * mole ** -1 * kilocalorie ** 1" idivf1="1.0"></Proper>
         <Proper smirks="[*:1]~[*:2]=[#6,#7,#16,#15;X2:3]=[*:4]" periodicity1="1" phase1="0.0 * degree ** 1" id="t167" k1="0.0 * mole ** -1 * kilocalorie ** 1" idivf1="1.0"></Proper>
     </ProperTorsions>
-    <ImproperTorsions version="0.3" potential="k*(1+cos(periodicity*theta-phase))" default_idivf="auto">
-        <Improper smirks="[*:1]~[#6X3:2](~[*:3])~[*:4]" periodicity1="2" phase1="180.0 * degree ** 1" k1="5.230790565314 * mole ** -1 * kilocalorie ** 1" id="i1"></Improper>
-        <Improper smirks="[*:1]~[#6X3:2](~[#8X1:3])~[#8:4]" periodicity1="2" phase1="180.0 * degree ** 1" k1="12.91569668378 * mole ** -1 * kilocalorie ** 1" id="i2"></Improper>
-        <Improper smirks="[*:1]~[#7X3$(*~[#15,#16](!-[*])):2](~[*:3])~[*:4]" periodicity1="2" phase1="180.0 * degree ** 1" k1="13.7015994787 * mole ** -1 * kilocalorie ** 1" id="i3"></Improper>
-        <Improper smirks="[*:1]~[#7X3$(*~[#6X3]):2](~[*:3])~[*:4]" periodicity1="2" phase1="180.0 * degree ** 1" k1="1.256262500552 * mole ** -1 * kilocalorie ** 1" id="i4"></Improper>
-        <Improper smirks="[*:1]~[#7X3$(*~[#7X2]):2](~[*:3])~[*:4]" periodicity1="2" phase1="180.0 * degree ** 1" k1="-2.341750027278 * mole ** -1 * kilocalorie ** 1" id="i5"></Improper>
-        <Improper smirks="[*:1]~[#7X3$(*@1-[*]=,:[*][*]=,:[*]@1):2](~[*:3])~[*:4]" periodicity1="2" phase1="180.0 * degree ** 1" k1="16.00585907359 * mole ** -1 * kilocalorie ** 1" id="i6"></Improper>
-        <Improper smirks="[*:1]~[#6X3:2](=[#7X2,#7X3+1:3])~[#7:4]" periodicity1="2" phase1="180.0 * degree ** 1" k1="10.12246975417 * mole ** -1 * kilocalorie ** 1" id="i7"></Improper>
-    </ImproperTorsions>
-    <vdW version="0.3" potential="Lennard-Jones-12-6" combining_rules="Lorentz-Berthelot" scale12="0.0" scale13="0.0" scale14="0.5" scale15="1.0" cutoff="9.0 * angstrom" switch_width="1.0 * angstrom" method="cutoff">
-        <Atom smirks="[#1:1]" epsilon="0.0157 * mole ** -1 * kilocalorie ** 1" id="n1" rmin_half="0.6 * angstrom ** 1"></Atom>
-        <Atom smirks="[#1:1]-[#6X4]" epsilon="0.01577948280971 * mole ** -1 * kilocalorie ** 1" id="n2" rmin_half="1.48419980825 * angstrom ** 1"></Atom>
-        <Atom smirks="[#1:1]-[#6X4]-[#7,#8,#9,#16,#17,#35]" epsilon="0.01640924602775 * mole ** -1 * kilocalorie ** 1" id="n3" rmin_half="1.449786411317 * angstrom ** 1"></Atom>
-        <Atom smirks="[#1:1]-[#6X4](-[#7,#8,#9,#16,#17,#35])-[#7,#8,#9,#16,#17,#35]" epsilon="0.0157 * mole ** -1 * kilocalorie ** 1" id="n4" rmin_half="1.287 * angstrom ** 1"></Atom>
-        <Atom smirks="[#1:1]-[#6X4](-[#7,#8,#9,#16,#17,#35])(-[#7,#8,#9,#16,#17,#35])-[#7,#8,#9,#16,#17,#35]" epsilon="0.0157 * mole ** -1 * kilocalorie ** 1" id="n5" rmin_half="1.187 * angstrom ** 1"></Atom>
-        <Atom smirks="[#1:1]-[#6X4]~[*+1,*+2]" epsilon="0.0157 * mole ** -1 * kilocalorie ** 1" id="n6" rmin_half="1.1 * angstrom ** 1"></Atom>
-        <Atom smirks="[#1:1]-[#6X3]" epsilon="0.01561134320353 * mole ** -1 * kilocalorie ** 1" id="n7" rmin_half="1.443812569645 * angstrom ** 1"></Atom>
-        <Atom smirks="[#1:1]-[#6X3]~[#7,#8,#9,#16,#17,#35]" epsilon="0.01310699839698 * mole ** -1 * kilocalorie ** 1" id="n8" rmin_half="1.377051329051 * angstrom ** 1"></Atom>
-        <Atom smirks="[#1:1]-[#6X3](~[#7,#8,#9,#16,#17,#35])~[#7,#8,#9,#16,#17,#35]" epsilon="0.01479744504464 * mole ** -1 * kilocalorie ** 1" id="n9" rmin_half="1.370482808197 * angstrom ** 1"></Atom>
-        <Atom smirks="[#1:1]-[#6X2]" epsilon="0.015 * mole ** -1 * kilocalorie ** 1" id="n10" rmin_half="1.459 * angstrom ** 1"></Atom>
-        <Atom smirks="[#1:1]-[#7]" epsilon="0.01409081474669 * mole ** -1 * kilocalorie ** 1" id="n11" rmin_half="0.6192778454102 * angstrom ** 1"></Atom>
-        <Atom smirks="[#1:1]-[#8]" epsilon="1.232599966667e-05 * mole ** -1 * kilocalorie ** 1" id="n12" rmin_half="0.2999999999997 * angstrom ** 1"></Atom>
-        <Atom smirks="[#1:1]-[#16]" epsilon="0.0157 * mole ** -1 * kilocalorie ** 1" id="n13" rmin_half="0.6 * angstrom ** 1"></Atom>
-        <Atom smirks="[#6:1]" epsilon="0.0868793154488 * mole ** -1 * kilocalorie ** 1" id="n14" rmin_half="1.953447017081 * angstrom ** 1"></Atom>
-        <Atom smirks="[#6X2:1]" epsilon="0.21 * mole ** -1 * kilocalorie ** 1" id="n15" rmin_half="1.908 * angstrom ** 1"></Atom>
-        <Atom smirks="[#6X4:1]" epsilon="0.1088406109251 * mole ** -1 * kilocalorie ** 1" id="n16" rmin_half="1.896698071741 * angstrom ** 1"></Atom>
-        <Atom smirks="[#8:1]" epsilon="0.2102061007896 * mole ** -1 * kilocalorie ** 1" id="n17" rmin_half="1.706036917087 * angstrom ** 1"></Atom>
-        <Atom smirks="[#8X2H0+0:1]" epsilon="0.1684651402602 * mole ** -1 * kilocalorie ** 1" id="n18" rmin_half="1.697783613804 * angstrom ** 1"></Atom>
-        <Atom smirks="[#8X2H1+0:1]" epsilon="0.2094735324129 * mole ** -1 * kilocalorie ** 1" id="n19" rmin_half="1.682099169199 * angstrom ** 1"></Atom>
-        <Atom smirks="[#7:1]" epsilon="0.1676915150424 * mole ** -1 * kilocalorie ** 1" id="n20" rmin_half="1.799798315098 * angstrom ** 1"></Atom>
-        <Atom smirks="[#16:1]" epsilon="0.25 * mole ** -1 * kilocalorie ** 1" id="n21" rmin_half="2.0 * angstrom ** 1"></Atom>
-        <Atom smirks="[#15:1]" epsilon="0.2 * mole ** -1 * kilocalorie ** 1" id="n22" rmin_half="2.1 * angstrom ** 1"></Atom>
-        <Atom smirks="[#9:1]" epsilon="0.061 * mole ** -1 * kilocalorie ** 1" id="n23" rmin_half="1.75 * angstrom ** 1"></Atom>
-        <Atom smirks="[#17:1]" epsilon="0.2656001046527 * mole ** -1 * kilocalorie ** 1" id="n24" rmin_half="1.85628721824 * angstrom ** 1"></Atom>
-        <Atom smirks="[#35:1]" epsilon="0.3218986365974 * mole ** -1 * kilocalorie ** 1" id="n25" rmin_half="1.969806594135 * angstrom ** 1"></Atom>
-        <Atom smirks="[#53:1]" epsilon="0.4 * mole ** -1 * kilocalorie ** 1" id="n26" rmin_half="2.35 * angstrom ** 1"></Atom>
-        <Atom smirks="[#3+1:1]" epsilon="0.0279896 * mole ** -1 * kilocalorie ** 1" id="n27" rmin_half="1.025 * angstrom ** 1"></Atom>
-        <Atom smirks="[#11+1:1]" epsilon="0.0874393 * mole ** -1 * kilocalorie ** 1" id="n28" rmin_half="1.369 * angstrom ** 1"></Atom>
-        <Atom smirks="[#19+1:1]" epsilon="0.1936829 * mole ** -1 * kilocalorie ** 1" id="n29" rmin_half="1.705 * angstrom ** 1"></Atom>
-        <Atom smirks="[#37+1:1]" epsilon="0.3278219 * mole ** -1 * kilocalorie ** 1" id="n30" rmin_half="1.813 * angstrom ** 1"></Atom>
-        <Atom smirks="[#55+1:1]" epsilon="0.4065394 * mole ** -1 * kilocalorie ** 1" id="n31" rmin_half="1.976 * angstrom ** 1"></Atom>
-        <Atom smirks="[#9X0-1:1]" epsilon="0.003364 * mole ** -1 * kilocalorie ** 1" id="n32" rmin_half="2.303 * angstrom ** 1"></Atom>
-        <Atom smirks="[#17X0-1:1]" epsilon="0.035591 * mole ** -1 * kilocalorie ** 1" id="n33" rmin_half="2.513 * angstrom ** 1"></Atom>
-        <Atom smirks="[#35X0-1:1]" epsilon="0.0586554 * mole ** -1 * kilocalorie ** 1" id="n34" rmin_half="2.608 * angstrom ** 1"></Atom>
-        <Atom smirks="[#53X0-1:1]" epsilon="0.0536816 * mole ** -1 * kilocalorie ** 1" id="n35" rmin_half="2.86 * angstrom ** 1"></Atom>
-        <Atom smirks="[#1]-[#8X2H2+0:1]-[#1]" epsilon="0.1521 * mole ** -1 * kilocalorie ** 1" id="n-tip3p-O" sigma="3.1507 * angstrom ** 1"></Atom>
-        <Atom smirks="[#1:1]-[#8X2H2+0]-[#1]" epsilon="0.0 * mole ** -1 * kilocalorie ** 1" id="n-tip3p-H" sigma="1 * angstrom ** 1"></Atom>
-        <Atom smirks="[#54:1]" epsilon="0.561 * kilocalorie ** 1 * mole ** -1" id="n36" sigma="4.363 * angstrom ** 1"></Atom>
-    </vdW>
-    <Electrostatics version="0.3" scale12="0.0" scale13="0.0" scale14="0.8333333333" scale15="1.0" cutoff="9.0 * angstrom" switch_width="0.0 * angstrom" method="PME"></Electrostatics>
-    <ToolkitAM1BCC version="0.3"></ToolkitAM1BCC>
 </SMIRNOFF>
 """
 
@@ -220,6 +220,31 @@ def generate(
         " " * 4,
     )
 
+    # only embed what can assign a low coverage parameter.
+    # Handlers without any are discarded by the script anyway, and as
+    # the last matching parameter wins, the parameters before a handler's
+    # first low coverage parameter can never decide whether one is assigned
+    low_coverage_parameters = {
+        group
+        for groups in needed_forcefield_groups.values()
+        for group in groups
+    }
+    for parameter_handler in list(forcefield.registered_parameter_handlers):
+        handler = forcefield.get_parameter_handler(parameter_handler)
+        labels = [
+            parameter.id if parameter.id else parameter.name
+            for parameter in handler.parameters
+        ]
+        low_coverage_indices = [
+            i for i, label in enumerate(labels)
+            if label in low_coverage_parameters
+        ]
+        if not low_coverage_indices:
+            forcefield.deregister_parameter_handler(parameter_handler)
+            continue
+        for _ in range(low_coverage_indices[0]):
+            del handler.parameters[0]
+
     date = datetime.datetime.now().strftime("%Y-%m-%d")
     forcefield_name = pathlib.Path(forcefield_path).name
     forcefield_xml_string = replace_v4_with_v3(forcefield.to_string())
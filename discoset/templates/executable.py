@@ -12,15 +12,24 @@ for which there is low coverage in our already available data.
 
 import argparse
 import contextlib
-import functools
+import hashlib
+import heapq
+import json
 import multiprocessing
 import pathlib
-import tempfile
+import shelve
 
 from openff.toolkit.topology import Molecule
 from openff.toolkit.typing.engines.smirnoff import ForceField
+import numpy as np
 import pandas as pd
 
+# RDKit is optional; without it, matching falls back to the OpenFF toolkit
+try:
+    from rdkit import Chem
+except ImportError:
+    Chem = None
+
 parser = argparse.ArgumentParser(
     description=(
         "Select molecules with chemistries where we are seeking to improve data coverage. "
@@ -94,6 +103,17 @@ parser.add_argument(
     ),
     required=False
 )
+parser.add_argument(
+    "-cd", "--cache-directory",
+    type=str,
+    default=None,
+    help=(
+        "If specified, cache the matches of each molecule in this directory, "
+        "so later runs with the same groups do not label it again. "
+        "If not specified, nothing is cached."
+    ),
+    required=False
+)
 
 
 def main():
@@ -109,6 +129,7 @@ def main():
         output_count_file=args.output_count,
         count_threshold=args.count_threshold,
         only_top_n=args.only_top_n,
+        cache_directory=args.cache_directory,
     )
 
 
@@ -151,6 +172,7 @@ def search_all_smiles(
     output_count_file: str = None,
     count_threshold: int = 1,
     only_top_n: int = -1,
+    cache_directory: str = None,
 ):
     """
     Search all SMILES strings for rare environments and write to a CSV file.
@@ -171,6 +193,8 @@ def search_all_smiles(
         Path to the output CSV file. If not specified, this file will not be written.
     output_count_file : str, optional
         Path to the output CSV file. If not specified, this file will not be written.
+    cache_directory : str, optional
+        Directory to cache matches in across runs. If not specified, nothing is cached.
     """
 
     # check inputs
@@ -189,56 +213,158 @@ def search_all_smiles(
     if only_top_n == 0:
         raise ValueError("-n/--only-top-n cannot be 0")
 
-    forcefield = load_forcefield()
-    empty_entry = {{ group: False for group in CHECKMOL_GROUPS }}
-    for parameter_id in LOW_COVERAGE_PARAMETERS:
-        empty_entry[parameter_id] = False
-    all_entries = []
-
-    labeller = functools.partial(
-        label_single_smiles,
-        forcefield=forcefield,
-        empty_entry=empty_entry,
-    )
-    with multiprocessing.Pool(nprocs) as pool:
-        all_entries = list(
-            _progress_bar(
-                pool.imap(labeller, smiles),
-                desc="Matching molecules",
-                total=len(smiles),
-            )
-        )
-    all_entries = [x for x in all_entries if x is not None]
-    if not len(all_entries):
+    # only label each unique molecule once, and only parse
+    # each distinct input SMILES once to find it
+    canonical_by_smiles = {{
+        smi: canonicalize_smiles(smi) for smi in dict.fromkeys(smiles)
+    }}
+    canonical_smiles = [canonical_by_smiles[smi] for smi in smiles]
+    unique_smiles = list(dict.fromkeys(canonical_smiles))
+
+    if cache_directory:
+        cache = shelve.open(get_cache_path(cache_directory))
+    else:
+        cache = contextlib.nullcontext({{}})
+
+    with cache as cache:
+        masks_by_smiles = {{
+            smi: cache[smi] for smi in unique_smiles if smi in cache
+        }}
+        smiles_to_label = [
+            smi for smi in unique_smiles if smi not in masks_by_smiles
+        ]
+
+        # each worker loads the force field once, so only SMILES are sent.
+        # Results are keyed by SMILES, so the order they arrive in does not matter
+        if smiles_to_label:
+            # forked workers inherit a force field loaded here, so it
+            # is parsed once instead of once per worker
+            if nprocs == 1 or multiprocessing.get_start_method() == "fork":
+                _init_worker()
+            if nprocs == 1:
+                # a single worker gains nothing from a child process,
+                # so label in this one and skip pickling every SMILES
+                pool = contextlib.nullcontext()
+                results = map(_label_keyed, smiles_to_label)
+            else:
+                chunksize = max(1, len(smiles_to_label) // (nprocs * 16))
+                pool = multiprocessing.Pool(nprocs, initializer=_init_worker)
+                results = pool.imap_unordered(
+                    _label_keyed, smiles_to_label, chunksize=chunksize
+                )
+            with pool:
+                for smi, mask in _progress_bar(
+                    results,
+                    desc="Matching molecules",
+                    total=len(smiles_to_label),
+                ):
+                    masks_by_smiles[smi] = cache[smi] = mask
+
+    if all(mask is None for mask in masks_by_smiles.values()):
         print(f"No valid matches found -- skipping writing to {{output_file}}")
         return
 
-    all_entries = sorted(all_entries, key=lambda x: x["Count"], reverse=True)
-    df = pd.DataFrame(all_entries)
-    df = df[df["Count"] >= count_threshold]
-
+    # expand back out to the input, keeping the original SMILES.
+    # Only the rows that will be written are kept, as (count, SMILES, mask)
+    def iter_rows():
+        for smi, canonical in zip(smiles, canonical_smiles):
+            mask = masks_by_smiles[canonical]
+            if mask is not None:
+                count = popcount(mask)
+                if count >= count_threshold:
+                    yield count, smi, mask
+
+    # both of these are stable, so ties keep their input order
     if only_top_n > 0:
-        df = df.head(only_top_n)
-
-    with open(output_file, "w") as f:
-        f.write("\\n".join(df["SMILES"].values))
-    print(f"Wrote {{len(df)}} molecules to {{output_file}}")
+        rows = heapq.nlargest(only_top_n, iter_rows(), key=lambda x: x[0])
+    else:
+        rows = sorted(iter_rows(), key=lambda x: x[0], reverse=True)
+
+    # stream the lines through a large buffer instead of joining them
+    # into one string; the file still has no trailing newline
+    with open(output_file, "w", buffering=1 << 20) as f:
+        f.writelines(
+            smi if i == 0 else "\\n" + smi
+            for i, (_, smi, _) in enumerate(rows)
+        )
+    print(f"Wrote {{len(rows)}} molecules to {{output_file}}")
 
-    core_keys = ["SMILES", "Count"]
-    added_keys = [col for col in df.columns if col not in core_keys]
     if output_count_file:
-        counts = df[added_keys].sum()
+        counts = sum_matches([mask for _, _, mask in rows])
+        counts = pd.Series(counts, index=KEY_ORDER)
         counts.to_csv(output_count_file, header=False)
         print(f"Wrote counts to {{output_count_file}}")
 
     if output_csv_file:
-        keys = core_keys + added_keys
-        df[keys].to_csv(output_csv_file, index=False)
-        n_groups = len(df.columns) - 2
-        print(f"Wrote {{len(df)}} molecules and matches to {{n_groups}} groups to {{output_csv_file}}")
+        with open(output_csv_file, "w") as f:
+            for i, df in enumerate(iter_match_tables(rows)):
+                df.to_csv(f, header=(i == 0), index=False)
+        n_groups = len(KEY_ORDER)
+        print(f"Wrote {{len(rows)}} molecules and matches to {{n_groups}} groups to {{output_csv_file}}")
+
 
+if hasattr(int, "bit_count"):  # Python 3.10+
+    popcount = int.bit_count
+else:
+    def popcount(mask: int) -> int:
+        """Count the number of bits set in a mask."""
+        return bin(mask).count("1")
 
 
+def sum_matches(masks, chunksize: int = 10000):
+    """Count how many masks have each bit set, a chunk at a time."""
+    counts = np.zeros(len(KEY_ORDER), dtype=np.int64)
+    for start in range(0, len(masks), chunksize):
+        chunk = masks[start:start + chunksize]
+        counts += unpack_masks(chunk, len(KEY_ORDER)).sum(axis=0)
+    return counts
+
+
+def iter_match_tables(rows, chunksize: int = 10000):
+    """
+    Yield tables of SMILES, Count, and matches to each group
+    from (count, SMILES, mask) rows, a chunk at a time.
+
+    This avoids holding the full boolean table in memory at once.
+    At least one table is always yielded, even if there are no rows.
+    """
+    for start in range(0, max(len(rows), 1), chunksize):
+        chunk = rows[start:start + chunksize]
+        matches = unpack_masks([mask for _, _, mask in chunk], len(KEY_ORDER))
+        df = pd.DataFrame(matches, columns=KEY_ORDER)
+        df.insert(0, "Count", [count for count, _, _ in chunk])
+        df.insert(0, "SMILES", [smi for _, smi, _ in chunk])
+        yield df
+
+
+def unpack_masks(masks, n_keys: int):
+    """
+    Unpack integer bitmasks into a boolean array.
+
+    Bit ``i`` of each mask becomes column ``i`` of its row.
+    """
+    n_bytes = max(1, (n_keys + 7) // 8)
+    packed = np.frombuffer(
+        b"".join(mask.to_bytes(n_bytes, "little") for mask in masks),
+        dtype=np.uint8,
+    ).reshape(-1, n_bytes)
+    bits = np.unpackbits(packed, axis=1, bitorder="little")
+    return bits[:, :n_keys].astype(bool)
+
+
+def get_cache_path(cache_directory: str) -> str:
+    """
+    Get the path of the cache for the groups and force field in this script.
+
+    The file name is a hash of everything that affects the matches,
+    so a cache written by a different version of this script is never read.
+    """
+    rules = json.dumps([CHECKMOL_GROUPS, KEY_ORDER, FORCEFIELD])
+    rules_hash = hashlib.blake2b(rules.encode(), digest_size=8).hexdigest()
+    cache_directory = pathlib.Path(str(cache_directory))
+    cache_directory.mkdir(exist_ok=True, parents=True)
+    return str(cache_directory / f"matches-{{rules_hash}}")
+
 
 def _progress_bar(iterable_, **kwargs):
     """Try to use tqdm if it is available, otherwise return the iterable."""
@@ -248,49 +374,250 @@ def _progress_bar(iterable_, **kwargs):
     except ImportError:
         return iterable_
 
+def canonicalize_smiles(smi: str) -> str:
+    """
+    Canonicalize a SMILES string so duplicate molecules can be identified.
+
+    If RDKit is not available, or the SMILES cannot be parsed,
+    the input SMILES is returned unchanged.
+    """
+    if Chem is None:
+        return smi
+
+    rdmol = Chem.MolFromSmiles(smi)
+    if rdmol is None:
+        return smi
+    return Chem.MolToSmiles(rdmol)
+
+def rdmol_from_smiles(smi: str):
+    """
+    Parse a SMILES string into an RDKit molecule with explicit hydrogens.
+
+    Aromaticity is perceived with the MDL model, as in the OpenFF toolkit,
+    so SMARTS matches are the same as with an OpenFF molecule.
+    Returns None if the SMILES cannot be parsed.
+    """
+    rdmol = Chem.MolFromSmiles(smi, sanitize=False)
+    if rdmol is None:
+        return None
+    try:
+        Chem.SanitizeMol(
+            rdmol,
+            Chem.SANITIZE_ALL
+            ^ Chem.SANITIZE_ADJUSTHS
+            ^ Chem.SANITIZE_SETAROMATICITY,
+        )
+        Chem.SetAromaticity(rdmol, Chem.AromaticityModel.AROMATICITY_MDL)
+    except Exception:
+        return None
+    return Chem.AddHs(rdmol)
+
 def load_forcefield():
     """Load the OpenFF 2.2.0 force field from the string below."""
-    # write force field to temp file and load
-    with tempfile.NamedTemporaryFile("w") as f:
-        f.write(FORCEFIELD)
-        forcefield = ForceField(f.name)
-    return forcefield
-
-def label_single_smiles(
-    smi: str,
-    forcefield: ForceField,
-    empty_entry,
-):
-    """Label a single SMILES string with rare environments."""
-    # ignore warnings about stereo
-    with capture_toolkit_warnings():
-        try:
-            mol = Molecule.from_smiles(smi, allow_undefined_stereo=True)
-        except Exception as e:
-            return None
+    # ForceField accepts the XML contents directly
+    return ForceField(FORCEFIELD)
 
-    atomic_numbers = [atom.atomic_number for atom in mol.atoms]
-    if 0 in atomic_numbers:
+def get_low_coverage_smirks(forcefield: ForceField):
+    """
+    Get the SMIRKS of each low coverage parameter in the force field.
+
+    Handlers without any low coverage parameters are deregistered
+    from the force field, as they can never contribute a match.
+    """
+    low_coverage_smirks = {{}}
+    for handler_name in list(forcefield.registered_parameter_handlers):
+        handler = forcefield.get_parameter_handler(handler_name)
+        n_found = len(low_coverage_smirks)
+        for parameter in handler.parameters:
+            label = parameter.id if parameter.id else parameter.name
+            if label in LOW_COVERAGE_PARAMETERS:
+                low_coverage_smirks[label] = parameter.smirks
+        if len(low_coverage_smirks) == n_found:
+            forcefield.deregister_parameter_handler(handler_name)
+    return low_coverage_smirks
+
+def compile_queries(patterns):
+    """
+    Compile SMARTS patterns to RDKit query molecules once.
+
+    Returns None if RDKit is not available, in which case
+    the OpenFF toolkit is used to match each SMARTS instead.
+    """
+    if Chem is None:
+        return None
+
+    return {{
+        name: Chem.MolFromSmarts(smirks)
+        for name, smirks in patterns.items()
+    }}
+
+def _get_node_elements(lines, i):
+    """
+    Return the elements required by the query node described on line ``i``
+    of an RDKit query description, and the index of the line after it.
+    """
+    depth = len(lines[i]) - len(lines[i].lstrip())
+    words = lines[i].split()
+    children = []
+    j = i + 1
+    while j < len(lines) and len(lines[j]) - len(lines[j].lstrip()) > depth:
+        child, j = _get_node_elements(lines, j)
+        children.append(child)
+
+    if words == ["AtomAnd"]:
+        return set().union(*children), j
+    if words == ["AtomOr"]:
+        return set.intersection(*children), j
+    if words[0] in ("AtomAtomicNum", "AtomType") and words[2:] == ["=", "val"]:
+        # aromatic atom types are offset by 1000
+        return {{int(words[1]) % 1000}}, j
+    # anything else, including negations and recursive SMARTS,
+    # does not require a particular element
+    return set(), j
+
+def get_required_elements(query):
+    """
+    Return the atomic numbers that any match of an RDKit query molecule
+    must contain. This errs on the side of requiring fewer elements.
+    """
+    required = set()
+    for atom in query.GetAtoms():
+        lines = [
+            line for line in atom.DescribeQuery().splitlines()
+            if line.strip()
+        ]
+        required |= _get_node_elements(lines, 0)[0]
+    return frozenset(required)
+
+def compile_catalogs(patterns):
+    """
+    Compile SMARTS patterns into RDKit FilterCatalogs,
+    so all of them can be matched against a molecule in a few calls.
+
+    Patterns are grouped by the uncommon elements they require, so
+    a molecule is only matched against the groups it could match.
+    Returns a list of (required elements, catalog) pairs,
+    or None if RDKit is not available.
+    """
+    queries = compile_queries(patterns)
+    if queries is None:
         return None
 
-    entry = dict(empty_entry)
+    from rdkit.Chem import FilterCatalog
+
+    catalogs = {{}}
+    for name, query in queries.items():
+        # nearly every molecule has these, so grouping
+        # on them would only add catalogs to check
+        required = get_required_elements(query) - {{1, 6, 7, 8}}
+        if required not in catalogs:
+            catalogs[required] = FilterCatalog.FilterCatalog()
+        # build from the query molecule so the SMARTS is matched as written
+        matcher = FilterCatalog.SmartsMatcher(name, query, 1)
+        catalogs[required].AddEntry(
+            FilterCatalog.FilterCatalogEntry(name, matcher)
+        )
+    return list(catalogs.items())
 
-    # does it match any checkmol groups?
-    for group, smirks in CHECKMOL_GROUPS.items():
-        matches = mol.chemical_environment_matches(smirks)
-        if len(matches):
-            entry[group] = True
+def find_matching_patterns(mol, rdmol, patterns, catalogs=None):
+    """
+    Yield the name of each SMARTS pattern that matches the molecule.
 
-    labels = forcefield.label_molecules(mol.to_topology())[0]
-    for parameters in labels.values():
-        for parameter in parameters.values():
-            label = parameter.id if parameter.id else parameter.name
-            if label in entry:
-                entry[label] = True
+    Compiled RDKit FilterCatalogs are used if given; otherwise
+    each pattern is matched with the OpenFF toolkit.
+    """
+    if catalogs is not None:
+        elements = {{atom.GetAtomicNum() for atom in rdmol.GetAtoms()}}
+        for required, catalog in catalogs:
+            if required <= elements:
+                for entry in catalog.GetMatches(rdmol):
+                    yield entry.GetDescription()
+    else:
+        for name, smirks in patterns.items():
+            if len(mol.chemical_environment_matches(smirks)):
+                yield name
+
+# set in each worker process by _init_worker
+_FORCEFIELD = None
+_KEY_INDEX = None
+_PATTERNS = None
+_CATALOGS = None
+
+def _init_worker():
+    """Load the force field and compile queries once per worker process."""
+    global _FORCEFIELD, _KEY_INDEX, _PATTERNS, _CATALOGS
+
+    # already set up in this process, or inherited from the parent
+    if _FORCEFIELD is not None:
+        return
 
-    entry["Count"] = sum(entry.values())
-    entry["SMILES"] = smi
-    return entry
+    _FORCEFIELD = load_forcefield()
+    _KEY_INDEX = {{ key: i for i, key in enumerate(KEY_ORDER) }}
+    # with RDKit, the checkmol groups and low coverage SMIRKS
+    # are all matched in a few calls
+    _PATTERNS = dict(CHECKMOL_GROUPS)
+    _PATTERNS.update(get_low_coverage_smirks(_FORCEFIELD))
+    _CATALOGS = compile_catalogs(_PATTERNS)
+
+def label_single_smiles(smi: str):
+    """
+    Label a single SMILES string with rare environments.
+
+    Returns an integer bitmask where bit ``i`` is set if ``KEY_ORDER[i]``
+    matches, or None if the SMILES is invalid.
+    This must be called in a process that has been set up with _init_worker.
+    """
+    if _CATALOGS is not None:
+        # parse with RDKit directly, as most molecules
+        # never need to be converted to an OpenFF molecule
+        mol = None
+        rdmol = rdmol_from_smiles(smi)
+        if rdmol is None:
+            return None
+        atomic_numbers = [atom.GetAtomicNum() for atom in rdmol.GetAtoms()]
+    else:
+        rdmol = None
+        # ignore warnings about stereo
+        with capture_toolkit_warnings():
+            try:
+                mol = Molecule.from_smiles(smi, allow_undefined_stereo=True)
+            except Exception as e:
+                return None
+        atomic_numbers = [atom.atomic_number for atom in mol.atoms]
+
+    if 0 in atomic_numbers:
+        return None
+
+    mask = 0
+    needs_labelling = False
+    for name in find_matching_patterns(mol, rdmol, _PATTERNS, _CATALOGS):
+        if name in CHECKMOL_GROUPS:
+            mask |= 1 << _KEY_INDEX[name]
+        else:
+            needs_labelling = True
+
+    # a parameter can only be assigned if its SMIRKS matches,
+    # so skip the expensive labelling if none of them do.
+    # A match does not mean it is assigned, as a later parameter may win
+    if needs_labelling:
+        if mol is None:
+            with capture_toolkit_warnings():
+                try:
+                    mol = Molecule.from_rdkit(rdmol, allow_undefined_stereo=True)
+                except Exception as e:
+                    return None
+        labels = _FORCEFIELD.label_molecules(mol.to_topology())[0]
+        for parameters in labels.values():
+            for parameter in parameters.values():
+                label = parameter.id if parameter.id else parameter.name
+                if label in _KEY_INDEX:
+                    mask |= 1 << _KEY_INDEX[label]
+
+    return mask
+
+def _label_keyed(smi: str):
+    """Label a SMILES string and return it with its mask."""
+    return smi, label_single_smiles(smi)
 
 @contextlib.contextmanager
 def capture_toolkit_warnings(run: bool = True):  # pragma: no cover
@@ -345,6 +672,9 @@ LOW_COVERAGE_PARAMETERS = [
 {low_coverage_parameters_string}
 ]
 
+# order of the bits in the masks returned by label_single_smiles
+KEY_ORDER = list(CHECKMOL_GROUPS) + LOW_COVERAGE_PARAMETERS
+
 FORCEFIELD = """\\
 {forcefield_xml_string}
 """